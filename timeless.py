@@ -13,19 +13,26 @@ napaka5 = 'Ups, prišlo je do napake. Vnesi le 1, 2 ali 3: '
 
 # Zahteva določene vrednosti za 'input()':
 def preveri(vnos, opcije, napaka, tip):
-    if tip == 'ime':
-        if not vnos.replace(' ','').isalpha():
-            return(preveri(input(napaka[0]), None, napaka, 'ime'))
-        elif len(string.capwords(vnos)) < 30:
-            return string.capwords(vnos)
+    while True:
+        if tip == 'ime':
+            if not vnos.replace(' ','').isalpha():
+                vnos = input(napaka[0])
+                continue
+            vnos = string.capwords(vnos)
+            if len(vnos) < 30:
+                return vnos
+            vnos = input(napaka[1])
         else:
-            return(preveri(input(napaka[1]), None, napaka, 'ime'))
-    else:
-        vnos = string.capwords(vnos)
-        if vnos in opcije:
-            return vnos
-        else:
-            return(preveri(input(napaka), opcije, napaka, None))
+            vnos = string.capwords(vnos)
+            if vnos in opcije:
+                return vnos
+            vnos = input(napaka)
+
+
+# Izpiše pairinge ene runde (oblika je vedno enaka, zato brez 'tabulate'):
+def izpisi_rundo(runda):
+    sirina = max(len(par[0]) for par in runda)
+    print('\n'.join('{}  VS  {}'.format(par[0].ljust(sirina), par[2]) for par in runda))
 
 
 # Sestavi in predstavi potek turnirja:
@@ -131,7 +138,7 @@ Veliko zabave pri igranju!
         dA, dB, dC, dD = [decki[matchup[X][Y]], decki[matchup[Y][X]], decki[matchup[Z][W]], decki[matchup[W][Z]]]
 
         runda = [[A + dA, 'VS', B + dB], [C + dC, 'VS', D + dD]]
-        print(tabulate(runda, tablefmt='plain'))
+        izpisi_rundo(runda)
 
         # Zabeleži zmage:
         zmage[preveri(input('\nKdo je zmagal, {} ali {}? '.format(A,B)), [A, B], napaka2, None)] += 1
@@ -140,10 +147,10 @@ Veliko zabave pri igranju!
         
 
     # Seznam parov (število zmag, igralec), urejen padajoče po zmagah (po treh rundah):
-    ur_pari = sorted(list(zip(zmage.values(), zmage.keys())), reverse = 1)
+    ur_pari = sorted(zip(zmage.values(), zmage.keys()), reverse = 1)
     
     # Pairingi za 4. rundo (v primerih 3210 in 2211):
-    if  [ur_pari[i][0] for i in range(4)] in [[3,2,1,0], [2,2,1,1]]:
+    if tuple(st_zmag for st_zmag, _ in ur_pari) in {(3, 2, 1, 0), (2, 2, 1, 1)}:
         
         print('\n4. runda:\n')
 
@@ -152,7 +159,7 @@ Veliko zabave pri igranju!
         dA, dB, dC, dD = [decki[igralci.index(ur_pari[i][1])] for i in range(4)]
 
         runda4 = [[A + dA, 'VS', B + dB], [C + dC, 'VS', D + dD]]        
-        print(tabulate(runda4, tablefmt='plain'))
+        izpisi_rundo(runda4)
 
         # Zabeleži zmage:
         prvi = preveri(input('\nKdo je zmagal, {} ali {}? '.format(A,B)), [A, B], napaka2, None)
@@ -183,7 +190,7 @@ Veliko zabave pri igranju!
             for i in range(4):
                 if zmage[imena[i]] == 4 - i:
                     nagrade[i] += prijavnina
-            nagrade = [str(i) + ' €' for i in nagrade]
+                nagrade[i] = str(nagrade[i]) + ' €'
 
 
     # Pairingi za 4. rundo (v primerih 3111 in 2220):    
@@ -199,14 +206,14 @@ Veliko zabave pri igranju!
         dA, dB, dC, dD = [decki[pairing[i]] for i in range(4)]
         
         runda4 = [[A + dA, 'VS', B + dB], [C + dC, 'VS', D + dD]]
-        print(tabulate(runda4, tablefmt='plain'))
+        izpisi_rundo(runda4)
 
         # Zabeleži zmage:
         zmage[preveri(input('\nKdo je zmagal, {} ali {}? '.format(A,B)), [A, B], napaka2, None)] += 1
         zmage[preveri(input('Kdo je zmagal, {} ali {}? '.format(C,D)), [C, D], napaka2, None)] += 1
 
         # Seznam parov (število zmag, igralec), urejen padajoče po zmagah (po štirih rundah):
-        ur_pari = sorted(list(zip(zmage.values(), zmage.keys())), reverse = 1)
+        ur_pari = sorted(zip(zmage.values(), zmage.keys()), reverse = 1)
 
         # Mesta, nagrade:
         porazdelitev = [st_zmag[0] for st_zmag in ur_pari]
@@ -237,11 +244,12 @@ Veliko zabave pri igranju!
 Turnir je zaključen!
 
 ----------------------STANDINGI---------------------
-''')
 
-    print(tabulate(standingi, headers=['Mesto', 'Igralec', 'Nagrada'], colalign=('center', 'left', 'left' if prijavnina == 3 else 'center')))
+{}
+
+
+Čestitke vsem igralcem!'''.format(tabulate(standingi, headers=['Mesto', 'Igralec', 'Nagrada'], colalign=('center', 'left', 'left' if prijavnina == 3 else 'center'))))
 
-    print('\n\nČestitke vsem igralcem!')
     input('\n====================================================\n(Za izhod pritisni ENTER.)')
     input('\nPa do naslednjič!')
 